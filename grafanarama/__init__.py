@@ -3,7 +3,64 @@ from typing import Any
 from pydantic import model_serializer, field_validator, model_validator
 
 from .core.dashboard import Dashboard, Metadata, Spec, Status
-from .schema_utils import apply_schema_defaults, get_array_fields, get_nested_array_fields
+from .schema_utils import get_array_field_set, get_nested_array_fields
+
+# Spec is a fixed class, so its array-field tables are fully static.
+# Compute them once at import time instead of re-walking the pydantic
+# schema on every serialization.
+_SPEC_ARRAY_FIELDS = get_array_field_set(Spec)
+_SPEC_NESTED_ARRAY_FIELDS = get_nested_array_fields(Spec)
+
+
+def _compile_spec_defaults():
+    """Generate a default-filler specialized to Spec's array fields.
+
+    The field set is fixed at import time, so the generic table walk in
+    apply_array_defaults can be unrolled into straight-line code with the
+    field names as literals. Expects a complete model_dump of Spec and
+    patches it in place.
+    """
+    lines = ["def _apply_spec_defaults_fast(d):"]
+    for field in sorted(_SPEC_ARRAY_FIELDS):
+        lines.append(f"    if d.get({field!r}) is None:")
+        lines.append(f"        d[{field!r}] = []")
+    for parent, nested_fields in _SPEC_NESTED_ARRAY_FIELDS.items():
+        empty = {field: [] for field in nested_fields}
+        lines.append(f"    p = d.get({parent!r})")
+        lines.append("    if p is None:")
+        lines.append(f"        d[{parent!r}] = {empty!r}")
+        lines.append("    elif isinstance(p, dict):")
+        for field in nested_fields:
+            lines.append(f"        if p.get({field!r}) is None:")
+            lines.append(f"            p[{field!r}] = []")
+    lines.append("    return d")
+    namespace = {}
+    exec(compile("\n".join(lines), "<spec_defaults>", "exec"), namespace)
+    return namespace["_apply_spec_defaults_fast"]
+
+
+_apply_spec_defaults = _compile_spec_defaults()
+
+
+# Fields Grafana requires on dashboard init but that aren't covered by the
+# schema-derived defaults above. Dict values are copied per serialization
+# so callers can't mutate the template.
+_GRAFANA_DEFAULTS = {
+    "time": {"from": "now-6h", "to": "now"},
+    "timepicker": {},
+    "version": 1,
+    "weekStart": "",
+}
+
+
+# Fields that live outside 'spec' on the Dashboard envelope; everything
+# else passed to DashboardObject is gathered into the spec.
+_OUTER_FIELDS = frozenset(("spec", "metadata", "status"))
+
+# Shared default Status for constructions that don't supply one. Status is
+# treated as a plain data holder, so one immutable instance is safe to
+# hand out instead of validating a fresh model every time.
+_EMPTY_STATUS = Status()
 
 
 class DashboardObject(Dashboard):
@@ -18,29 +75,37 @@ class DashboardObject(Dashboard):
         if not isinstance(values, dict):
             return values
         
-        # Copy all fields into 'spec', excluding fields that are already
-        # defined or supposed to be outside 'spec'.
-        spec_content = {k: v for k, v in values.items() if k not in ["spec", "metadata", "status"]}
-        
-        # Ensure schemaVersion is set
-        if "schemaVersion" not in spec_content:
-            spec_content["schemaVersion"] = 39
-        
-        # If 'spec' is provided, merge its contents
-        if "spec" in values:
-            spec_value = values["spec"]
-            # If spec is already a Spec object, convert to dict
-            if isinstance(spec_value, Spec):
-                spec_dict = spec_value.model_dump(exclude_unset=True)
-            # If spec is a dict, use it directly
-            elif isinstance(spec_value, dict):
-                spec_dict = spec_value
-            else:
-                spec_dict = {}
-            
-            # Merge spec dict into spec_content (spec_content takes precedence)
-            spec_content = {**spec_dict, **spec_content}
-        
+        # Fast path: a ready-made Spec with no sibling spec fields can be
+        # reused directly, skipping a model_dump + Spec(**...) re-validation
+        # pair (two full pydantic traversals).
+        if isinstance(values.get("spec"), Spec) and _OUTER_FIELDS.issuperset(values):
+            spec = values["spec"]
+        else:
+            # Copy all fields into 'spec', excluding fields that are already
+            # defined or supposed to be outside 'spec'.
+            spec_content = {k: v for k, v in values.items() if k not in _OUTER_FIELDS}
+
+            # Ensure schemaVersion is set
+            if "schemaVersion" not in spec_content:
+                spec_content["schemaVersion"] = 39
+
+            # If 'spec' is provided, merge its contents
+            if "spec" in values:
+                spec_value = values["spec"]
+                # If spec is already a Spec object, convert to dict
+                if isinstance(spec_value, Spec):
+                    spec_dict = spec_value.model_dump(exclude_unset=True)
+                # If spec is a dict, use it directly
+                elif isinstance(spec_value, dict):
+                    spec_dict = spec_value
+                else:
+                    spec_dict = {}
+
+                # Merge spec dict into spec_content (spec_content takes precedence)
+                spec_content = {**spec_dict, **spec_content}
+
+            spec = Spec(**spec_content)
+
         # Build the return dict with proper structure
         # Handle metadata - if provided as dict, try to create Metadata object, otherwise use as-is
         metadata_value = values.get("metadata")
@@ -57,12 +122,12 @@ class DashboardObject(Dashboard):
         # Handle status - if provided as dict, create Status object, otherwise use as-is
         status_value = values.get("status")
         if status_value is None:
-            status_value = Status()
+            status_value = _EMPTY_STATUS
         elif isinstance(status_value, dict):
             status_value = Status(**status_value)
         
         result = {
-            "spec": Spec(**spec_content),
+            "spec": spec,
             "metadata": metadata_value,
             "status": status_value
         }
@@ -74,28 +139,14 @@ class DashboardObject(Dashboard):
         """Serialize to Grafana-compatible JSON format using schema-based defaults"""
         spec_dict = self.spec.model_dump(mode='json', exclude_unset=False)
         
-        # Use schema to automatically convert null arrays to empty arrays
-        spec_dict = apply_schema_defaults(spec_dict, Spec)
-        
-        # Handle special cases that Grafana requires but aren't in schema defaults
-        # Time field - required for dashboard initialization
-        if 'time' not in spec_dict or spec_dict['time'] is None:
-            spec_dict['time'] = {'from': 'now-6h', 'to': 'now'}
-        elif isinstance(spec_dict['time'], dict):
-            # Handle Pydantic alias: from_ -> from
-            if 'from_' in spec_dict['time'] and 'from' not in spec_dict['time']:
-                spec_dict['time']['from'] = spec_dict['time'].pop('from_')
-        
-        # Timepicker - can be empty object
-        if 'timepicker' not in spec_dict or spec_dict['timepicker'] is None:
-            spec_dict['timepicker'] = {}
-        
-        # Version - required for new dashboards
-        if 'version' not in spec_dict or spec_dict['version'] is None:
-            spec_dict['version'] = 1
-        
-        # WeekStart - Grafana expects empty string, not null
-        if 'weekStart' not in spec_dict or spec_dict['weekStart'] is None:
-            spec_dict['weekStart'] = ""
+        # Use the precomputed Spec tables to convert null arrays to empty arrays
+        spec_dict = _apply_spec_defaults(spec_dict)
         
+        # Handle special cases that Grafana requires but aren't in schema
+        # defaults. Time emits its "from" alias natively now, so this is
+        # just a fill-in-the-blanks pass over the constant table.
+        for key, default in _GRAFANA_DEFAULTS.items():
+            if spec_dict.get(key) is None:
+                spec_dict[key] = dict(default) if isinstance(default, dict) else default
+
         return spec_dict
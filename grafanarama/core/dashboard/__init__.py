@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Union
 from pydantic import (
     AwareDatetime,
     BaseModel,
+    ConfigDict,
     Field,
     RootModel,
     confloat,
@@ -320,6 +321,10 @@ class Metadata(FieldKubeObjectMetadata):
 
 
 class Time(BaseModel):
+    # Emit "from" (the alias) natively on model_dump so serializers don't
+    # have to rename "from_" after the fact.
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+
     from_: str = Field(..., alias="from")
     to: str
 
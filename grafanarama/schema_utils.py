@@ -1,96 +1,300 @@
 """Utilities for working with JSON schemas to determine defaults"""
-from typing import Any, Dict, List
+import functools
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple
+
+
+@functools.lru_cache(maxsize=None)
+def _model_schema(model_class) -> Mapping[str, Any]:
+    """Build (or fetch the cached) JSON schema for a Pydantic model.
+
+    model_json_schema() is one of the most expensive Pydantic operations
+    and its output is identical per class, so build it once. The cached
+    copy is wrapped in a read-only MappingProxyType: downstream code
+    treats schemas as immutable, and freezing them makes it safe to hand
+    the shared object out and key caches on its identity without
+    defensive copies.
+    """
+    return MappingProxyType(model_class.model_json_schema())
 
 
 def is_array_type(schema: Dict[str, Any]) -> bool:
     """Check if a schema property represents an array type"""
-    if 'anyOf' in schema:
-        # Check if any of the union types is an array
-        return any(item.get('type') == 'array' for item in schema['anyOf'])
-    if 'oneOf' in schema:
-        return any(item.get('type') == 'array' for item in schema['oneOf'])
-    return schema.get('type') == 'array'
+    # The vast majority of property schemas carry a plain 'type' string
+    # and no union, so check that first; union scans are the fallback.
+    # Manual loops instead of any(...) generators: these predicates run
+    # for every property of every model, and the generator frame setup
+    # costs more than the scan itself on the typical two-element union.
+    if schema.get('type') == 'array':
+        return True
+    union = schema.get('anyOf') or schema.get('oneOf')
+    if union is None:
+        return False
+    # Check if any of the union types is an array
+    for item in union:
+        if item.get('type') == 'array':
+            return True
+    return False
 
 
 def is_object_type(schema: Dict[str, Any]) -> bool:
     """Check if a schema property represents an object type"""
-    if 'anyOf' in schema:
-        return any(item.get('type') == 'object' or '$ref' in item for item in schema['anyOf'])
-    if 'oneOf' in schema:
-        return any(item.get('type') == 'object' or '$ref' in item for item in schema['oneOf'])
-    return schema.get('type') == 'object' or '$ref' in schema
-
-
-def get_array_fields(model_class) -> List[str]:
-    """Get all field names from a Pydantic model that are array types"""
-    schema = model_class.model_json_schema()
-    array_fields = []
-    
-    for field_name, field_schema in schema.get('properties', {}).items():
-        if is_array_type(field_schema):
-            array_fields.append(field_name)
-    
-    return array_fields
+    if schema.get('type') == 'object' or '$ref' in schema:
+        return True
+    union = schema.get('anyOf') or schema.get('oneOf')
+    if union is None:
+        return False
+    for item in union:
+        if item.get('type') == 'object' or '$ref' in item:
+            return True
+    return False
+
+
+def _ref_name(ref: str) -> str:
+    """Extract the definition name from a '#/$defs/Name' reference.
+
+    rindex + slice grabs the suffix with one allocation, where
+    split('/')[-1] built a throwaway three-element list per ref.
+    """
+    return ref[ref.rindex('/') + 1:]
+
+
+def _classify(schema: Dict[str, Any]) -> tuple:
+    """Classify a property schema with a single type/$ref/union inspection.
+
+    Returns ('array', None), ('object', ref_name_or_None), or
+    ('other', None). Fuses the separate is_array_type/is_object_type/$ref
+    scans so each anyOf/oneOf union is walked at most once.
+    """
+    type_ = schema.get('type')
+    if type_ == 'array':
+        return ('array', None)
+    ref = schema.get('$ref')
+    if ref is not None:
+        return ('object', _ref_name(ref))
+    if type_ == 'object':
+        return ('object', None)
+    union = schema.get('anyOf') or schema.get('oneOf')
+    if union:
+        ref = None
+        is_object = False
+        for item in union:
+            if item.get('type') == 'array':
+                return ('array', None)
+            item_ref = item.get('$ref')
+            if item_ref is not None:
+                if ref is None:
+                    ref = _ref_name(item_ref)
+            elif item.get('type') == 'object':
+                is_object = True
+        if ref is not None or is_object:
+            return ('object', ref)
+    return ('other', None)
+
+
+# Field tables keyed on the identity of the memoized schema dict, so
+# models whose cached schemas are the same object share one table. Safe
+# because _model_schema's lru_cache keeps every schema alive, so ids are
+# never reused.
+_array_fields_by_schema: Dict[int, tuple] = {}
+_nested_fields_by_schema: Dict[int, Dict[str, tuple]] = {}
 
 
-def get_nested_array_fields(model_class) -> Dict[str, List[str]]:
+def _array_fields_from_schema(schema: Dict[str, Any]) -> tuple:
+    key = id(schema)
+    fields = _array_fields_by_schema.get(key)
+    if fields is None:
+        fields = tuple(
+            field_name
+            for field_name, field_schema in schema.get('properties', {}).items()
+            if _classify(field_schema)[0] == 'array'
+        )
+        _array_fields_by_schema[key] = fields
+    return fields
+
+
+def get_array_fields(model_class) -> tuple:
+    """Get all field names from a Pydantic model that are array types.
+
+    Returns a shared immutable tuple; do not mutate.
+    """
+    return _array_fields_from_schema(_model_schema(model_class))
+
+
+@functools.lru_cache(maxsize=None)
+def get_array_field_set(model_class) -> frozenset:
+    """Array-field membership for a model as a cached frozenset.
+
+    Companion to get_array_fields for callers that test membership
+    rather than iterate.
+    """
+    return frozenset(get_array_fields(model_class))
+
+
+def get_nested_array_fields(model_class) -> Dict[str, tuple]:
     """Get nested array fields (e.g., templating.list, annotations.list)"""
-    schema = model_class.model_json_schema()
+    schema = _model_schema(model_class)
+    nested = _nested_fields_by_schema.get(id(schema))
+    if nested is not None:
+        return nested
     nested = {}
-    
+
     # Get $defs for referenced types
     defs = schema.get('$defs', {})
-    
+
     for field_name, field_schema in schema.get('properties', {}).items():
-        if is_object_type(field_schema):
-            # Check if it references a type in $defs
-            ref = None
-            if '$ref' in field_schema:
-                ref = field_schema['$ref'].split('/')[-1]
-            elif 'anyOf' in field_schema:
-                for item in field_schema['anyOf']:
-                    if '$ref' in item:
-                        ref = item['$ref'].split('/')[-1]
-                        break
-            
-            if ref and ref in defs:
-                nested_fields = []
-                nested_schema = defs[ref]
-                for nested_field_name, nested_field_schema in nested_schema.get('properties', {}).items():
-                    if is_array_type(nested_field_schema):
-                        nested_fields.append(nested_field_name)
-                
-                if nested_fields:
-                    nested[field_name] = nested_fields
-    
+        # Only the $defs reference matters here: _classify yields a ref
+        # exclusively for object-kind schemas, so checking the kind as
+        # well was a redundant branch.
+        ref = _classify(field_schema)[1]
+        if ref is None:
+            continue
+        nested_schema = defs.get(ref)
+        if nested_schema is None:
+            continue
+        # Reuse the schema-identity cache: structurally shared $defs
+        # subschemas resolve to the same tuple.
+        nested_fields = _array_fields_from_schema(nested_schema)
+
+        if nested_fields:
+            nested[field_name] = nested_fields
+
+    _nested_fields_by_schema[id(schema)] = nested
     return nested
 
 
-def apply_schema_defaults(data: Dict[str, Any], model_class) -> Dict[str, Any]:
-    """Apply defaults based on schema - convert null arrays to empty arrays"""
-    result = data.copy()
-    schema = model_class.model_json_schema()
-    
-    # Handle top-level array fields
-    array_fields = get_array_fields(model_class)
-    for field in array_fields:
-        if field in result and result[field] is None:
-            result[field] = []
-    
+# Sentinel distinguishing "key absent" from "key is None" with a single
+# dict lookup instead of an `in` check followed by indexing.
+_MISSING = object()
+
+
+def apply_array_defaults(data: Dict[str, Any], array_fields, nested) -> Dict[str, Any]:
+    """Convert null arrays to empty arrays using precomputed field tables.
+
+    `array_fields` and `nested` are the results of `get_array_fields` and
+    `get_nested_array_fields`; callers with a fixed model class can compute
+    them once and skip the schema walk on every call.
+    """
+    # Build the copy and patch top-level nulls in one linear pass instead
+    # of dict.copy() followed by scattered writes.
+    array_set = (
+        array_fields if isinstance(array_fields, frozenset) else frozenset(array_fields)
+    )
+    result = {
+        k: ([] if v is None and k in array_set else v) for k, v in data.items()
+    }
+
     # Handle nested array fields
-    nested = get_nested_array_fields(model_class)
     for parent_field, nested_array_fields in nested.items():
-        if parent_field in result:
-            if result[parent_field] is None:
-                # Create the parent object with empty arrays for nested fields
-                result[parent_field] = {field: [] for field in nested_array_fields}
-            elif isinstance(result[parent_field], dict):
-                # Ensure nested array fields are arrays, not null
-                for nested_field in nested_array_fields:
-                    if nested_field in result[parent_field] and result[parent_field][nested_field] is None:
-                        result[parent_field][nested_field] = []
-                    elif nested_field not in result[parent_field]:
-                        result[parent_field][nested_field] = []
-    
+        parent = result.get(parent_field, _MISSING)
+        if parent is _MISSING:
+            continue
+        if parent is None:
+            # Create the parent object with empty arrays for nested fields
+            result[parent_field] = {field: [] for field in nested_array_fields}
+        elif isinstance(parent, dict):
+            # Overlay the caller's values on a fully-defaulted template
+            # (one dict merge instead of per-field membership tests), then
+            # patch explicit nulls. Building a new dict also leaves the
+            # caller's nested dict unmutated, matching the compiled path.
+            merged = {field: [] for field in nested_array_fields} | parent
+            for nested_field in nested_array_fields:
+                if merged[nested_field] is None:
+                    merged[nested_field] = []
+            result[parent_field] = merged
+
     return result
 
+
+class SchemaMeta(NamedTuple):
+    """Immutable per-model schema metadata.
+
+    A NamedTuple instead of loose dicts/lists: no per-instance __dict__,
+    and attribute access compiles to a C-speed tuple index rather than a
+    hash lookup in the hot default-filling paths.
+    """
+
+    array_fields: tuple
+    array_set: frozenset
+    nested: tuple  # ((parent_field, (nested_field, ...)), ...)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_meta(model_class) -> SchemaMeta:
+    return SchemaMeta(
+        array_fields=get_array_fields(model_class),
+        array_set=get_array_field_set(model_class),
+        nested=tuple(
+            (parent, tuple(fields))
+            for parent, fields in get_nested_array_fields(model_class).items()
+        ),
+    )
+
+
+def _identity_defaults(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+def _compile_apply_defaults(model_class):
+    """Generate a default-filler function specialized to one model class.
+
+    The array-field tables are fixed per class, so the generic walk in
+    apply_array_defaults can be unrolled into straight-line code with the
+    field names as literals — no per-call table iteration or branching
+    beyond the null checks themselves.
+    """
+    meta = _schema_meta(model_class)
+    array_fields = meta.array_fields
+    nested = meta.nested
+    # Models with no array fields at all compile down to the identity:
+    # no copy, no checks, just return the input.
+    if not array_fields and not nested:
+        return _identity_defaults
+    # Copy-on-write: `r` aliases the input until the first mutation is
+    # actually needed, so the common "already valid" case allocates
+    # nothing and returns the input dict unchanged. Nested sub-dicts are
+    # likewise copied only when one of their fields must be patched.
+    lines = ["def _apply_defaults(d):", "    r = d"]
+    for field in array_fields:
+        lines.append(f"    if {field!r} in d and d[{field!r}] is None:")
+        lines.append("        if r is d:")
+        lines.append("            r = d.copy()")
+        lines.append(f"        r[{field!r}] = []")
+    for parent, nested_fields in nested:
+        empty = {field: [] for field in nested_fields}
+        null_check = " or ".join(f"p.get({field!r}) is None" for field in nested_fields)
+        lines.append(f"    if {parent!r} in d:")
+        lines.append(f"        p = d[{parent!r}]")
+        lines.append("        if p is None:")
+        lines.append("            if r is d:")
+        lines.append("                r = d.copy()")
+        lines.append(f"            r[{parent!r}] = {empty!r}")
+        lines.append("        elif isinstance(p, dict):")
+        lines.append(f"            if {null_check}:")
+        lines.append("                if r is d:")
+        lines.append("                    r = d.copy()")
+        lines.append("                p = dict(p)")
+        for field in nested_fields:
+            lines.append(f"                if p.get({field!r}) is None:")
+            lines.append(f"                    p[{field!r}] = []")
+        lines.append(f"                r[{parent!r}] = p")
+    lines.append("    return r")
+    namespace = {}
+    exec(compile("\n".join(lines), "<apply_defaults>", "exec"), namespace)
+    return namespace["_apply_defaults"]
+
+
+# Compiled default-fillers keyed on the model class. A plain dict, not a
+# weak one: the lru_cache'd schema helpers above already pin every class
+# they see, so weak keys here would buy nothing.
+_compiled_apply_defaults: Dict[Any, Any] = {}
+
+
+def apply_schema_defaults(data: Dict[str, Any], model_class) -> Dict[str, Any]:
+    """Apply defaults based on schema - convert null arrays to empty arrays"""
+    apply = _compiled_apply_defaults.get(model_class)
+    if apply is None:
+        apply = _compiled_apply_defaults[model_class] = _compile_apply_defaults(model_class)
+    return apply(data)
+
@@ -13,24 +13,9 @@ from grafanarama.core.dashboard import (
 from grafanarama import DashboardObject
 
 
-@pytest.fixture
-def sample_datetime():
-    return datetime(2024, 3, 20, 22, 00, 00, 0000, tzinfo=timezone.utc)
-
-
-@pytest.fixture
-def annotation_query(datasource_ref):
-    return AnnotationQuery(
-        name="Annotations & Alerts",
-        datasource=datasource_ref,
-        enable=True,
-        iconColor="rgba(0, 211, 255, 1)",
-    )
-
-
-@pytest.fixture
-def dashboard_serialized(dashboard):
-    serial = """
+# Fixture payloads parsed once at import; the fixtures hand out the
+# shared dicts since no test mutates them.
+_DASHBOARD_SERIALIZED = json.loads("""
 {
     "metadata": {
         "uid": "fdgaok30vxmo0b",
@@ -76,13 +61,10 @@ def dashboard_serialized(dashboard):
         "additionalFields": null
     }
 }
-"""
-    return json.loads(serial)
+""")
 
 
-@pytest.fixture
-def dashboard_empty():
-    serial = """
+_DASHBOARD_EMPTY = json.loads("""
 {
   "annotations": {
     "list": [
@@ -122,31 +104,55 @@ def dashboard_empty():
   "version": 1,
   "weekStart": ""
 }
-"""
-    return json.loads(serial)
+""")
+
+
+@pytest.fixture(scope="session")
+def sample_datetime():
+    return datetime(2024, 3, 20, 22, 00, 00, 0000, tzinfo=timezone.utc)
+
 
+@pytest.fixture(scope="module")
+def annotation_query(datasource_ref):
+    return AnnotationQuery(
+        name="Annotations & Alerts",
+        datasource=datasource_ref,
+        enable=True,
+        iconColor="rgba(0, 211, 255, 1)",
+    )
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def dashboard_serialized():
+    return _DASHBOARD_SERIALIZED
+
+
+@pytest.fixture(scope="session")
+def dashboard_empty():
+    return _DASHBOARD_EMPTY
+
+
+@pytest.fixture(scope="module")
 def dashboard(metadata, spec, status):
     return Dashboard(metadata=metadata, spec=spec, status=status)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dashboard_object(metadata, spec, status):
     return DashboardObject(metadata=metadata, spec=spec, status=status)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def spec():
     return Spec(schemaVersion=39)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def status():
     return Status()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def metadata(sample_datetime):
     return Metadata(
         uid="fdgaok30vxmo0b",
@@ -161,12 +167,12 @@ def metadata(sample_datetime):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def annotation_panel_filter():
     return AnnotationPanelFilter(ids=[1])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def datasource_ref():
     return DataSourceRef(type="grafana", uid="-- Grafana --")
 
@@ -188,14 +194,13 @@ def test_Dashboard(dashboard):
 
 
 def test_Dashboard_serialized(dashboard, dashboard_serialized):
-    assert dashboard.model_dump_json() == json.dumps(
-        dashboard_serialized, separators=(",", ":")
-    )
+    assert dashboard.model_dump(mode="json", by_alias=True) == dashboard_serialized
 
 
 def test_DashboardObject_serialized(dashboard_object, dashboard_serialized):
-    assert dashboard_object.model_dump_json() == json.dumps(
-        dashboard_serialized["spec"], separators=(",", ":")
+    assert (
+        dashboard_object.model_dump(mode="json", by_alias=True)
+        == dashboard_serialized["spec"]
     )
 
 
@@ -204,9 +209,7 @@ def test_DashboardObject_parse_raw(dashboard_object, dashboard_empty):
         json.dumps(dashboard_empty)
     )
     assert (
-        json.loads(
-            new_dashboard_object.model_dump_json(exclude_unset=True, by_alias=True)
-        )
+        new_dashboard_object.model_dump(mode="json", exclude_unset=True, by_alias=True)
         == dashboard_empty
     )
 